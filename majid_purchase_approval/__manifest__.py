@@ -13,6 +13,7 @@
             - Email notification untuk setiap tahap approval
             - Logging aktivitas approval di chatter
             - Dashboard untuk monitoring approval
+            - Report analisis approval (cycle time per level, throughput, rejection rate)
     """,
     'author': 'Majid',
     'website': 'https://id.linkedin.com/in/adha-syah-majid-7a6b12197',
@@ -25,8 +26,10 @@
         'security/purchase_approval_security.xml',
         'security/ir.model.access.csv',
         'data/mail_template.xml',
+        'data/ir_cron.xml',
         'views/purchase_order_views.xml',
         'views/res_users_views.xml',
+        'report/purchase_approval_report_views.xml',
         'wizard/purchase_rejection_wizard_views.xml',
     ],
     'installable': True,
@@ -1,2 +1,3 @@
 from . import purchase_order
+from . import purchase_approval_simulator
 from . import res_users 
\ No newline at end of file
@@ -56,12 +56,26 @@ class PurchaseOrder(models.Model):
     # Computed fields
     my_approvals = fields.Boolean(string='My Approvals', compute='_compute_my_approvals', search='_search_my_approvals')
     
+    @api.model
+    def _get_approval_policy(self):
+        """Policy approval aktif: batas nilai threshold dan flow level per threshold"""
+        return {
+            'low_limit': 5000000,
+            'high_limit': 20000000,
+            'flows': {
+                'low': ['manager'],
+                'medium': ['dept_head', 'cfo'],
+                'high': ['cfo'],
+            },
+        }
+    
     @api.depends('amount_total')
     def _compute_approval_threshold(self):
+        policy = self._get_approval_policy()
         for po in self:
-            if po.amount_total < 5000000:
+            if po.amount_total < policy['low_limit']:
                 po.approval_threshold = 'low'
-            elif po.amount_total <= 20000000:
+            elif po.amount_total <= policy['high_limit']:
                 po.approval_threshold = 'medium'
             else:
                 po.approval_threshold = 'high'
@@ -91,43 +105,7 @@ class PurchaseOrder(models.Model):
         """Override button_confirm untuk custom approval flow"""
         self = self.filtered(lambda order: order._approval_allowed())
         
-        for order in self:
-            current_level = order.approval_level
-            approval_flow = order._get_approval_flow()
-            
-            # Update approval info
-            if current_level == 'manager':
-                order.approved_by_manager = self.env.user
-                order.approved_date_manager = fields.Datetime.now()
-                # Jika hanya perlu approval manager, langsung approve
-                if len(approval_flow) == 1:
-                    order.write({'state': 'purchase', 'date_approve': fields.Datetime.now()})
-                    order.approval_level = False
-                    order._log_approval_activity('approve', self.env.user, 'Final approval - PO menjadi Purchase Order')
-                else:
-                    # Lanjut ke level berikutnya
-                    next_level = approval_flow[1]  # dept_head
-                    order.approval_level = next_level
-                    order.state = 'dept_head_approval'
-                    order._log_approval_activity('approve', self.env.user, 'Menunggu approval Department Head')
-                    order._send_approval_notification()
-                    
-            elif current_level == 'dept_head':
-                order.approved_by_dept_head = self.env.user
-                order.approved_date_dept_head = fields.Datetime.now()
-                # Lanjut ke CFO
-                order.approval_level = 'cfo'
-                order.state = 'cfo_approval'
-                order._log_approval_activity('approve', self.env.user, 'Menunggu approval CFO')
-                order._send_approval_notification()
-                
-            elif current_level == 'cfo':
-                order.approved_by_cfo = self.env.user
-                order.approved_date_cfo = fields.Datetime.now()
-                # Final approval
-                order.write({'state': 'purchase', 'date_approve': fields.Datetime.now()})
-                order.approval_level = False
-                order._log_approval_activity('approve', self.env.user, 'Final approval - PO menjadi Purchase Order')
+        self._approve_current_level()
         
         return {}
     
@@ -255,43 +233,7 @@ class PurchaseOrder(models.Model):
         """Custom approval flow method"""
         self = self.filtered(lambda order: order._approval_allowed())
         
-        for order in self:
-            current_level = order.approval_level
-            approval_flow = order._get_approval_flow()
-            
-            # Update approval info
-            if current_level == 'manager':
-                order.approved_by_manager = self.env.user
-                order.approved_date_manager = fields.Datetime.now()
-                # Jika hanya perlu approval manager, langsung approve
-                if len(approval_flow) == 1:
-                    order.write({'state': 'purchase', 'date_approve': fields.Datetime.now()})
-                    order.approval_level = False
-                    order._log_approval_activity('approve', self.env.user, 'Final approval - PO menjadi Purchase Order')
-                else:
-                    # Lanjut ke level berikutnya
-                    next_level = approval_flow[1]  # dept_head
-                    order.approval_level = next_level
-                    order.state = 'dept_head_approval'
-                    order._log_approval_activity('approve', self.env.user, 'Menunggu approval Department Head')
-                    order._send_approval_notification()
-                    
-            elif current_level == 'dept_head':
-                order.approved_by_dept_head = self.env.user
-                order.approved_date_dept_head = fields.Datetime.now()
-                # Lanjut ke CFO
-                order.approval_level = 'cfo'
-                order.state = 'cfo_approval'
-                order._log_approval_activity('approve', self.env.user, 'Menunggu approval CFO')
-                order._send_approval_notification()
-                
-            elif current_level == 'cfo':
-                order.approved_by_cfo = self.env.user
-                order.approved_date_cfo = fields.Datetime.now()
-                # Final approval
-                order.write({'state': 'purchase', 'date_approve': fields.Datetime.now()})
-                order.approval_level = False
-                order._log_approval_activity('approve', self.env.user, 'Final approval - PO menjadi Purchase Order')
+        self._approve_current_level()
         
         # Return action untuk refresh halaman
         if len(self) == 1:
@@ -306,6 +248,41 @@ class PurchaseOrder(models.Model):
         
         return {}
     
+    def _approve_current_level(self):
+        """Approve level saat ini lalu lanjut ke level berikutnya sesuai approval flow"""
+        level_labels = dict(self._fields['approval_level'].selection)
+        
+        for order in self:
+            current_level = order.approval_level
+            if not current_level:
+                continue
+            
+            approval_flow = order._get_approval_flow()
+            
+            # Flow bisa berubah setelah PO di-submit (policy atau nilai total berubah),
+            # jangan sampai approval di level yang tidak ada di flow dianggap final
+            if current_level not in approval_flow:
+                raise UserError(_('Approval flow Purchase Order %s sudah berubah, silakan submit ulang untuk approval') % order.name)
+            
+            # Update approval info
+            order.write({
+                'approved_by_%s' % current_level: self.env.user.id,
+                'approved_date_%s' % current_level: fields.Datetime.now(),
+            })
+            
+            if current_level == approval_flow[-1]:
+                # Final approval
+                order.write({'state': 'purchase', 'date_approve': fields.Datetime.now()})
+                order.approval_level = False
+                order._log_approval_activity('approve', self.env.user, 'Final approval - PO menjadi Purchase Order')
+            else:
+                # Lanjut ke level berikutnya di approval flow
+                next_level = approval_flow[approval_flow.index(current_level) + 1]
+                order.approval_level = next_level
+                order.state = '%s_approval' % next_level
+                order._log_approval_activity('approve', self.env.user, 'Menunggu approval %s' % level_labels[next_level])
+                order._send_approval_notification()
+    
     def action_reject(self):
         """Membuka wizard untuk alasan rejection"""
         self.ensure_one()
@@ -329,14 +306,8 @@ class PurchaseOrder(models.Model):
         """Mendapatkan flow approval berdasarkan threshold"""
         self.ensure_one()
         
-        if self.approval_threshold == 'low':
-            return ['manager']
-        elif self.approval_threshold == 'medium':
-            return ['dept_head', 'cfo']
-        elif self.approval_threshold == 'high':
-            return ['cfo']
-        
-        return []
+        flows = self._get_approval_policy()['flows']
+        return list(flows.get(self.approval_threshold, []))
     
     def _get_approver_for_level(self, level):
         """Mendapatkan user approver untuk level tertentu"""
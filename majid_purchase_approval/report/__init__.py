@@ -0,0 +1 @@
+from . import purchase_approval_report
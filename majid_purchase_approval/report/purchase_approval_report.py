@@ -0,0 +1,180 @@
+from odoo import models, fields, api
+from odoo.tools import SQL
+import logging
+
+_logger = logging.getLogger(__name__)
+
+class PurchaseApprovalReport(models.Model):
+    _name = 'purchase.approval.report'
+    _description = 'Purchase Approval Analysis'
+    _auto = False
+    _rec_name = 'order_id'
+    _order = 'submitted_date desc'
+
+    # Informasi PO
+    order_id = fields.Many2one('purchase.order', string='Purchase Order', readonly=True)
+    partner_id = fields.Many2one('res.partner', string='Vendor', readonly=True)
+    company_id = fields.Many2one('res.company', string='Company', readonly=True)
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True)
+    submitted_by = fields.Many2one('res.users', string='Submitted By', readonly=True)
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('sent', 'RFQ Sent'),
+        ('to approve', 'To Approve'),
+        ('manager_approval', 'Manager'),
+        ('dept_head_approval', 'Department Head'),
+        ('cfo_approval', 'CFO'),
+        ('purchase', 'Purchase Order'),
+        ('done', 'Locked'),
+        ('cancel', 'Cancelled'),
+        ('rejected', 'Rejected')
+    ], string='Status', readonly=True)
+    approval_threshold = fields.Selection([
+        ('low', 'Low (< 5M)'),
+        ('medium', 'Medium (5M-20M)'),
+        ('high', 'High (> 20M)')
+    ], string='Approval Threshold', readonly=True)
+    amount_total = fields.Monetary(string='Total', currency_field='currency_id', readonly=True,
+                                   help='Nilai total PO dalam mata uang company')
+
+    # Timestamp approval
+    submitted_date = fields.Datetime(string='Submitted Date', readonly=True)
+    approved_date_manager = fields.Datetime(string='Manager Approval Date', readonly=True)
+    approved_date_dept_head = fields.Datetime(string='Department Head Approval Date', readonly=True)
+    approved_date_cfo = fields.Datetime(string='CFO Approval Date', readonly=True)
+    rejected_date = fields.Datetime(string='Rejection Date', readonly=True)
+    decision_date = fields.Datetime(string='Decision Date', readonly=True,
+                                    help='Tanggal final approval atau rejection')
+
+    # Cycle time per level (dalam jam)
+    manager_cycle_hours = fields.Float(string='Manager Cycle Time (h)', readonly=True, aggregator='avg')
+    dept_head_cycle_hours = fields.Float(string='Department Head Cycle Time (h)', readonly=True, aggregator='avg')
+    cfo_cycle_hours = fields.Float(string='CFO Cycle Time (h)', readonly=True, aggregator='avg')
+    total_cycle_hours = fields.Float(string='Total Cycle Time (h)', readonly=True, aggregator='avg')
+
+    # Throughput dan rejection rate
+    nbr_approved = fields.Integer(string='# Approved', readonly=True)
+    nbr_rejected = fields.Integer(string='# Rejected', readonly=True)
+    nbr_decided = fields.Integer(string='# Decided', readonly=True)
+    rejection_rate = fields.Float(string='Rejection Rate (%)', readonly=True, aggregator='avg',
+                                  help='Persentase PO yang di-reject dari PO yang sudah diputuskan')
+
+    @api.model
+    def _approval_date_sql(self, field_name):
+        """Tanggal approval/rejection yang berlaku untuk submission terakhir.
+
+        Tanggal yang lebih lama dari ``submitted_date`` berasal dari submission
+        sebelumnya (misalnya setelah cancel lalu submit ulang) dan diabaikan.
+        """
+        column = SQL.identifier('po', field_name)
+        return SQL("CASE WHEN %s >= po.submitted_date THEN %s END", column, column)
+
+    @api.model
+    def _level_wait_sql(self):
+        """Expression durasi (detik) per level approval, dihitung dari approval sebelumnya"""
+        manager = self._approval_date_sql('approved_date_manager')
+        dept_head = self._approval_date_sql('approved_date_dept_head')
+        cfo = self._approval_date_sql('approved_date_cfo')
+        return {
+            'manager': SQL("EXTRACT(EPOCH FROM %s - po.submitted_date)", manager),
+            'dept_head': SQL(
+                "EXTRACT(EPOCH FROM %s - COALESCE(%s, po.submitted_date))",
+                dept_head, manager,
+            ),
+            'cfo': SQL(
+                "EXTRACT(EPOCH FROM %s - COALESCE(GREATEST(%s, %s), po.submitted_date))",
+                cfo, manager, dept_head,
+            ),
+        }
+
+    def _select(self):
+        level_wait = self._level_wait_sql()
+        return SQL("""
+            po.id AS id,
+            po.id AS order_id,
+            po.partner_id AS partner_id,
+            po.company_id AS company_id,
+            company.currency_id AS currency_id,
+            po.submitted_by AS submitted_by,
+            po.state AS state,
+            po.approval_threshold AS approval_threshold,
+            po.amount_total / COALESCE(NULLIF(po.currency_rate, 0), 1) AS amount_total,
+            po.submitted_date AS submitted_date,
+            %(approved_date_manager)s AS approved_date_manager,
+            %(approved_date_dept_head)s AS approved_date_dept_head,
+            %(approved_date_cfo)s AS approved_date_cfo,
+            %(rejected_date)s AS rejected_date,
+            decision.decision_date AS decision_date,
+            %(manager_wait)s / 3600.0 AS manager_cycle_hours,
+            %(dept_head_wait)s / 3600.0 AS dept_head_cycle_hours,
+            %(cfo_wait)s / 3600.0 AS cfo_cycle_hours,
+            EXTRACT(EPOCH FROM decision.decision_date - po.submitted_date) / 3600.0 AS total_cycle_hours,
+            CASE WHEN po.state IN ('purchase', 'done') THEN 1 ELSE 0 END AS nbr_approved,
+            CASE WHEN po.state = 'rejected' THEN 1 ELSE 0 END AS nbr_rejected,
+            CASE WHEN decision.decision_date IS NOT NULL THEN 1 ELSE 0 END AS nbr_decided,
+            CASE
+                WHEN po.state = 'rejected' THEN 100.0
+                WHEN po.state IN ('purchase', 'done') THEN 0.0
+            END AS rejection_rate
+        """,
+            approved_date_manager=self._approval_date_sql('approved_date_manager'),
+            approved_date_dept_head=self._approval_date_sql('approved_date_dept_head'),
+            approved_date_cfo=self._approval_date_sql('approved_date_cfo'),
+            rejected_date=self._approval_date_sql('rejected_date'),
+            manager_wait=level_wait['manager'],
+            dept_head_wait=level_wait['dept_head'],
+            cfo_wait=level_wait['cfo'],
+        )
+
+    def _from(self):
+        return SQL("""
+            purchase_order po
+            JOIN res_company company ON company.id = po.company_id
+            CROSS JOIN LATERAL (
+                SELECT CASE
+                    WHEN po.state = 'rejected' THEN %(rejected_date)s
+                    WHEN po.state IN ('purchase', 'done') THEN GREATEST(
+                        %(approved_date_manager)s,
+                        %(approved_date_dept_head)s,
+                        %(approved_date_cfo)s
+                    )
+                END AS decision_date
+            ) decision
+        """,
+            rejected_date=self._approval_date_sql('rejected_date'),
+            approved_date_manager=self._approval_date_sql('approved_date_manager'),
+            approved_date_dept_head=self._approval_date_sql('approved_date_dept_head'),
+            approved_date_cfo=self._approval_date_sql('approved_date_cfo'),
+        )
+
+    def _where(self):
+        return SQL("po.submitted_date IS NOT NULL")
+
+    def _query(self):
+        return SQL("SELECT %s FROM %s WHERE %s", self._select(), self._from(), self._where())
+
+    def init(self):
+        """Buat materialized view untuk report approval.
+
+        Unique index pada kolom id dibutuhkan agar view bisa di-refresh secara
+        concurrent tanpa mengunci pembacaan report.
+        """
+        self.env.cr.execute(SQL("DROP MATERIALIZED VIEW IF EXISTS %s CASCADE", SQL.identifier(self._table)))
+        self.env.cr.execute(SQL(
+            "CREATE MATERIALIZED VIEW %s AS (%s)",
+            SQL.identifier(self._table),
+            self._query(),
+        ))
+        self.env.cr.execute(SQL(
+            "CREATE UNIQUE INDEX %s ON %s (id)",
+            SQL.identifier(self._table + '_id_uniq'),
+            SQL.identifier(self._table),
+        ))
+
+    @api.model
+    def _refresh_materialized_view(self):
+        """Refresh data report approval, dipanggil oleh scheduled action"""
+        self.env.flush_all()
+        self.env.cr.execute(SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY %s", SQL.identifier(self._table)))
+        self.invalidate_model()
+        _logger.info('Materialized view %s berhasil di-refresh', self._table)
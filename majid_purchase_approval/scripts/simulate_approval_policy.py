@@ -0,0 +1,20 @@
+# Simulasi policy approval PO terhadap data historis, dijalankan lewat odoo shell.
+#
+# Contoh:
+#   APPROVAL_POLICY='{"low_limit": 10000000, "flows": {"medium": ["cfo"]}}' \
+#   APPROVAL_DATE_FROM=2022-01-01 \
+#   odoo shell -d <database> --no-http < majid_purchase_approval/scripts/simulate_approval_policy.py
+#
+# APPROVAL_POLICY memakai format purchase.order._get_approval_policy(); key yang
+# tidak diisi mengikuti policy aktif. Set APPROVAL_COMPANY_CURRENCY=1 untuk
+# membandingkan threshold dengan nilai dalam mata uang company.
+import json
+import os
+
+result = env['purchase.approval.simulator']._simulate(
+    policy=json.loads(os.environ.get('APPROVAL_POLICY') or '{}'),
+    date_from=os.environ.get('APPROVAL_DATE_FROM') or None,
+    date_to=os.environ.get('APPROVAL_DATE_TO') or None,
+    company_currency=os.environ.get('APPROVAL_COMPANY_CURRENCY') == '1',
+)
+print(json.dumps(result, indent=4))
@@ -0,0 +1,3 @@
+from . import test_purchase_approval_report
+from . import test_purchase_approval_flow
+from . import test_purchase_approval_simulator
\ No newline at end of file
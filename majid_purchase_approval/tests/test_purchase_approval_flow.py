@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+from odoo.exceptions import UserError
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestPurchaseApprovalFlow(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.partner = cls.env['res.partner'].create({'name': 'Vendor Approval'})
+        cls.product = cls.env['product.product'].create({'name': 'Produk Approval'})
+
+    def _create_order(self, price_unit):
+        return self.env['purchase.order'].create({
+            'partner_id': self.partner.id,
+            'order_line': [(0, 0, {
+                'product_id': self.product.id,
+                'product_qty': 1,
+                'price_unit': price_unit,
+                'taxes_id': [(5, 0, 0)],
+            })],
+        })
+
+    def _patch_flows(self, flows):
+        return patch.object(
+            self.registry['purchase.order'], '_get_approval_flow',
+            lambda order: list(flows.get(order.approval_threshold, [])),
+        )
+
+    def test_default_medium_flow(self):
+        order = self._create_order(10000000)
+        order.action_submit_for_approval()
+        self.assertEqual((order.state, order.approval_level), ('dept_head_approval', 'dept_head'))
+
+        order.action_approve()
+        self.assertEqual((order.state, order.approval_level), ('cfo_approval', 'cfo'))
+
+        order.action_approve()
+        self.assertEqual(order.state, 'purchase')
+        self.assertFalse(order.approval_level)
+        self.assertTrue(order.approved_date_dept_head and order.approved_date_cfo)
+
+    def test_flow_follows_approval_flow(self):
+        """State berikutnya mengikuti entry setelah level saat ini di approval flow"""
+        flows = {'low': ['manager', 'cfo'], 'medium': ['dept_head'], 'high': ['cfo']}
+
+        with self._patch_flows(flows):
+            low_order = self._create_order(1000000)
+            low_order.action_submit_for_approval()
+            low_order.action_approve()
+            self.assertEqual((low_order.state, low_order.approval_level), ('cfo_approval', 'cfo'))
+            low_order.action_approve()
+            self.assertEqual(low_order.state, 'purchase')
+
+            medium_order = self._create_order(10000000)
+            medium_order.action_submit_for_approval()
+            medium_order.action_approve()
+            self.assertEqual(medium_order.state, 'purchase')
+            self.assertFalse(medium_order.approved_date_cfo)
+
+    def test_flow_changed_after_submit(self):
+        """Level yang sudah tidak ada di flow tidak boleh menjadi final approval"""
+        order = self._create_order(1000000)
+        order.action_submit_for_approval()
+        self.assertEqual((order.state, order.approval_level), ('manager_approval', 'manager'))
+
+        with self._patch_flows({'low': ['cfo']}), self.assertRaises(UserError):
+            order.action_approve()
+        self.assertEqual(order.state, 'manager_approval')
+        self.assertFalse(order.approved_date_manager)
+
+    def test_amount_changed_after_submit(self):
+        """Nilai total yang berubah di luar form memindahkan PO ke band lain"""
+        order = self._create_order(1000000)
+        order.action_submit_for_approval()
+        order.order_line.price_unit = 10000000
+        self.assertEqual(order.approval_threshold, 'medium')
+
+        with self.assertRaises(UserError):
+            order.action_approve()
+        self.assertEqual(order.state, 'manager_approval')
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestPurchaseApprovalReport(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.partner = cls.env['res.partner'].create({'name': 'Vendor Approval Report'})
+        cls.product = cls.env['product.product'].create({'name': 'Produk Approval Report'})
+        cls.start = datetime(2026, 1, 5, 8, 0, 0)
+
+    def _create_order(self, price_unit):
+        return self.env['purchase.order'].create({
+            'partner_id': self.partner.id,
+            'order_line': [(0, 0, {
+                'product_id': self.product.id,
+                'product_qty': 1,
+                'price_unit': price_unit,
+                'taxes_id': [(5, 0, 0)],
+            })],
+        })
+
+    def _at(self, hours):
+        return self.start + timedelta(hours=hours)
+
+    def _get_report_lines(self, orders):
+        self.env['purchase.approval.report']._refresh_materialized_view()
+        lines = self.env['purchase.approval.report'].search([('order_id', 'in', orders.ids)])
+        return {line.order_id: line for line in lines}
+
+    def test_approval_report(self):
+        # Low: manager langsung final approval
+        low_order = self._create_order(1000000)
+        low_order.action_submit_for_approval()
+        low_order.action_approve()
+        low_order.write({
+            'submitted_date': self._at(0),
+            'approved_date_manager': self._at(2),
+        })
+
+        # Medium dengan approval manager lebih dulu: setiap level dihitung dari approval sebelumnya
+        medium_order = self._create_order(10000000)
+        medium_order.action_submit_for_approval()
+        medium_order.action_approve()
+        medium_order.action_approve()
+        medium_order.write({
+            'submitted_date': self._at(0),
+            'approved_date_manager': self._at(1),
+            'approved_date_dept_head': self._at(4),
+            'approved_date_cfo': self._at(10),
+        })
+
+        rejected_order = self._create_order(1000000)
+        rejected_order.action_submit_for_approval()
+        rejected_order.reject_po('Harga terlalu tinggi')
+        rejected_order.write({'submitted_date': self._at(0), 'rejected_date': self._at(1)})
+
+        # Submit ulang setelah reject: tanggal dari submission sebelumnya diabaikan
+        resubmitted_order = self._create_order(1000000)
+        resubmitted_order.action_submit_for_approval()
+        resubmitted_order.reject_po('Vendor salah')
+        resubmitted_order.write({'state': 'draft', 'approved_date_cfo': self._at(0.5), 'rejected_date': self._at(1)})
+        resubmitted_order.action_submit_for_approval()
+        resubmitted_order.submitted_date = self._at(5)
+        resubmitted_order.action_approve()
+        resubmitted_order.approved_date_manager = self._at(7)
+
+        pending_order = self._create_order(1000000)
+        pending_order.action_submit_for_approval()
+
+        draft_order = self._create_order(1000000)
+
+        orders = low_order | medium_order | rejected_order | resubmitted_order | pending_order | draft_order
+        lines = self._get_report_lines(orders)
+
+        self.assertNotIn(draft_order, lines, 'PO yang belum di-submit tidak masuk report')
+
+        line = lines[low_order]
+        self.assertAlmostEqual(line.manager_cycle_hours, 2.0)
+        self.assertAlmostEqual(line.total_cycle_hours, 2.0)
+        self.assertEqual(line.decision_date, self._at(2))
+        self.assertEqual((line.nbr_approved, line.nbr_rejected, line.nbr_decided), (1, 0, 1))
+        self.assertEqual(line.rejection_rate, 0.0)
+
+        line = lines[medium_order]
+        self.assertAlmostEqual(line.manager_cycle_hours, 1.0)
+        self.assertAlmostEqual(line.dept_head_cycle_hours, 3.0)
+        self.assertAlmostEqual(line.cfo_cycle_hours, 6.0)
+        self.assertAlmostEqual(line.total_cycle_hours, 10.0)
+        self.assertEqual(line.decision_date, self._at(10))
+
+        line = lines[rejected_order]
+        self.assertAlmostEqual(line.total_cycle_hours, 1.0)
+        self.assertEqual(line.decision_date, self._at(1))
+        self.assertEqual((line.nbr_approved, line.nbr_rejected, line.nbr_decided), (0, 1, 1))
+        self.assertEqual(line.rejection_rate, 100.0)
+
+        line = lines[resubmitted_order]
+        self.assertFalse(line.rejected_date)
+        self.assertFalse(line.approved_date_cfo)
+        self.assertFalse(line.cfo_cycle_hours)
+        self.assertAlmostEqual(line.manager_cycle_hours, 2.0)
+        self.assertAlmostEqual(line.total_cycle_hours, 2.0)
+        self.assertEqual(line.decision_date, self._at(7))
+        self.assertEqual((line.nbr_approved, line.nbr_rejected, line.nbr_decided), (1, 0, 1))
+
+        line = lines[pending_order]
+        self.assertFalse(line.decision_date)
+        self.assertEqual((line.nbr_approved, line.nbr_rejected, line.nbr_decided), (0, 0, 0))
+
+        # Rejection rate hanya dihitung dari PO yang sudah diputuskan: 1 dari 4
+        [(rejection_rate,)] = self.env['purchase.approval.report']._read_group(
+            [('order_id', 'in', orders.ids)], aggregates=['rejection_rate:avg'],
+        )
+        self.assertAlmostEqual(rejection_rate, 25.0)
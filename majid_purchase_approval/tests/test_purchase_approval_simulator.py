@@ -0,0 +1,71 @@
+import unittest
+
+from odoo.exceptions import UserError
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.majid_purchase_approval.models.purchase_approval_simulator import np
+
+
+@tagged('post_install', '-at_install')
+@unittest.skipIf(np is None, 'numpy tidak terinstall')
+class TestPurchaseApprovalSimulator(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.simulator = cls.env['purchase.approval.simulator']
+        cls.policy = cls.env['purchase.order']._get_approval_policy()
+        cls.wait_hours = np.array([1.0, 2.0, 4.0])
+
+    def test_replay_band_edges(self):
+        """Tepat di low_limit masuk medium, tepat di high_limit tetap medium"""
+        amounts = np.array([4999999.0, 5000000.0, 20000000.0, 20000001.0])
+        result = self.simulator._replay(amounts, self.policy, self.wait_hours)
+
+        self.assertEqual(result['bands'].tolist(), [1, 2, 1])
+        # manager: 1 PO low, dept_head: 2 PO medium, cfo: 2 PO medium + 1 PO high
+        self.assertEqual(result['volume'].tolist(), [1, 2, 3])
+        self.assertAlmostEqual(result['latency'], (1.0 + 6.0 + 6.0 + 4.0) / 4)
+
+    def test_replay_empty_history(self):
+        result = self.simulator._replay(np.array([], dtype=float), self.policy, self.wait_hours)
+
+        self.assertEqual(result['bands'].tolist(), [0, 0, 0])
+        self.assertEqual(result['volume'].tolist(), [0, 0, 0])
+        self.assertEqual(result['latency'], 0.0)
+
+    def test_simulate_empty_history(self):
+        result = self.simulator._simulate(date_from='2999-01-01')
+
+        self.assertEqual(result['order_count'], 0)
+        self.assertEqual(result['added_latency_hours'], 0.0)
+        self.assertEqual(result['levels']['cfo']['projected_volume'], 0)
+
+    def test_merge_policy_keeps_active_values(self):
+        merged = self.simulator._merge_policy(self.policy, {'flows': {'medium': ['cfo']}})
+
+        self.assertEqual(merged['low_limit'], self.policy['low_limit'])
+        self.assertEqual(merged['flows']['low'], self.policy['flows']['low'])
+        self.assertEqual(merged['flows']['medium'], ['cfo'])
+
+    def test_merge_policy_rejects_invalid_policy(self):
+        invalid_policies = [
+            {'flows': {'low': ['manager', 'director']}},
+            {'flows': {'urgent': ['cfo']}},
+            {'flows': {'low': 'manager'}},
+            {'flows': {'low': []}},
+            {'flows': {'low': ['manager', 'manager']}},
+            {'low_limit': '5000000'},
+            {'high_limit': True},
+            {'low_limit': 30000000},
+            {'low_limt': 10000000},
+        ]
+        for policy in invalid_policies:
+            with self.subTest(policy=policy), self.assertRaises(UserError):
+                self.simulator._merge_policy(self.policy, policy)
+
+    def test_approver_shares(self):
+        shares = self.simulator._approver_shares(np.array([7.0, 7.0, 9.0, np.nan]))
+
+        self.assertEqual(shares, {7: 2 / 3, 9: 1 / 3})
+        self.assertEqual(self.simulator._approver_shares(np.array([np.nan])), {})